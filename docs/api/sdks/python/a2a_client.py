@@ -10,10 +10,16 @@ Author: Gemini Flow A2A Team
 """
 
 import asyncio
+import gzip
+import itertools
 import json
+from collections import defaultdict
+import random
+import struct
+import sys
 import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union, Literal
 import logging
@@ -24,9 +30,41 @@ import aiohttp
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+# Prefer the new asyncio client (faster reader, Sans-I/O core); fall back to
+# the legacy implementation on older websockets releases, whose connect()
+# takes extra_headers rather than additional_headers.
+try:
+    from websockets.asyncio.client import connect as _ws_connect
+    _WS_HEADERS_KWARG = 'additional_headers'
+except ImportError:
+    _ws_connect = websockets.connect
+    _WS_HEADERS_KWARG = 'extra_headers'
+
+# orjson is optional but recommended: its C-accelerated encoder/decoder is
+# several times faster than the stdlib on the small JSON frames A2A exchanges.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+    _json_loads = json.loads
+
+# msgpack is likewise optional; the client only speaks it when the caller
+# prefers it AND the server negotiates it via the response content type
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 # Core Configuration Types
-@dataclass
+@dataclass(slots=True)
 class A2ACertificate:
     """SSL certificate configuration for A2A authentication"""
     cert_file: str
@@ -35,17 +73,26 @@ class A2ACertificate:
     passphrase: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryPolicy:
     """Retry policy configuration"""
     max_retries: int = 3
     backoff_strategy: Literal['linear', 'exponential', 'custom'] = 'exponential'
     base_delay: float = 1.0
     max_delay: float = 30.0
-    retryable_errors: List[str] = field(default_factory=lambda: ['NETWORK_TIMEOUT', 'CONNECTION_FAILED'])
+    retryable_errors: List[str] = field(default_factory=lambda: [
+        'NETWORK_TIMEOUT', 'CONNECTION_FAILED',
+        'A2A_TIMEOUT_ERROR', 'A2A_CONNECTION_ERROR'
+    ])
+    # Frozen view of retryable_errors for O(1) membership tests on the
+    # retry path; the public list is kept for API compatibility
+    _retryable_set: frozenset = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self._retryable_set = frozenset(self.retryable_errors)
 
-@dataclass
+
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration"""
     level: Literal['DEBUG', 'INFO', 'WARN', 'ERROR'] = 'INFO'
@@ -53,7 +100,7 @@ class LoggingConfig:
     enable_response_logging: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AClientConfig:
     """Main client configuration"""
     base_url: str
@@ -63,6 +110,41 @@ class A2AClientConfig:
     retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
     websocket_enabled: bool = True
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    # HTTP connection pool tuning
+    pool_limit: int = 100
+    pool_limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    # Compress HTTP bodies at or above this size (requires server support)
+    http_compression: bool = False
+    compression_threshold: int = 1024
+    # WebSocket tuning: per-message-deflate rarely pays off for small A2A
+    # frames, so compression is off unless explicitly set to 'deflate'
+    ws_compression: Optional[str] = None
+    ws_max_size: int = 2 ** 20
+    # How long resolved group/broadcast targets stay reusable
+    target_cache_ttl: float = 30.0
+    # Client-side cache for eventual-consistency memory reads (<= 0 disables)
+    read_cache_ttl: float = 5.0
+    read_cache_size: int = 1024
+    # Stamp messages with a syscall-fresh clock instead of the coarse
+    # millisecond tick (only worth it if you need sub-ms timestamps)
+    precise_timestamps: bool = False
+    # Reuse one HTTP session/connector across clients with the same endpoint
+    shared_session: bool = False
+    # Multiplex message POSTs over one HTTP/2 connection (needs the optional
+    # httpx package; silently falls back to aiohttp HTTP/1.1 without it)
+    http2: bool = False
+    # Install uvloop (when available) from create_a2a_client
+    use_uvloop: bool = True
+    # Offer msgpack for the HTTP wire format (requires the optional msgpack
+    # package and a server that answers in kind)
+    prefer_msgpack: bool = False
+    # Coalesce concurrent direct sends into one POST (requires /a2a/batch
+    # server support; the client falls back per-message when it is missing)
+    batching: bool = False
+    batch_max_size: int = 64
+    batch_window: float = 0.002
 
 
 # Agent and Targeting Types
@@ -87,7 +169,7 @@ class AgentRole(Enum):
     RESOURCE_ALLOCATOR = "resource-allocator"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentFilter:
     """Filter criteria for agent selection"""
     role: Optional[AgentRole] = None
@@ -96,7 +178,7 @@ class AgentFilter:
     swarm_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCondition:
     """Conditional criteria for agent targeting"""
     type: Literal['capability', 'resource', 'status', 'location', 'custom']
@@ -105,14 +187,14 @@ class AgentCondition:
 
 
 # Agent Targeting Classes
-@dataclass
+@dataclass(slots=True)
 class SingleTarget:
     """Target a single specific agent"""
     type: Literal['single'] = 'single'
     agent_id: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class MultipleTargets:
     """Target multiple specific agents"""
     type: Literal['multiple'] = 'multiple'
@@ -120,7 +202,7 @@ class MultipleTargets:
     coordination_mode: Literal['parallel', 'sequential', 'race'] = 'parallel'
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupTarget:
     """Target agents by role/capabilities"""
     type: Literal['group'] = 'group'
@@ -130,7 +212,7 @@ class GroupTarget:
     selection_strategy: Literal['random', 'load-balanced', 'capability-matched'] = 'load-balanced'
 
 
-@dataclass
+@dataclass(slots=True)
 class BroadcastTarget:
     """Broadcast to multiple agents with filter"""
     type: Literal['broadcast'] = 'broadcast'
@@ -138,7 +220,7 @@ class BroadcastTarget:
     exclude_source: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalTarget:
     """Target agents based on conditions"""
     type: Literal['conditional'] = 'conditional'
@@ -151,7 +233,7 @@ AgentTarget = Union[SingleTarget, MultipleTargets, GroupTarget, BroadcastTarget,
 
 
 # Coordination Mode Types
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DirectCoordination:
     """Direct 1-to-1 coordination"""
     mode: Literal['direct'] = 'direct'
@@ -160,7 +242,7 @@ class DirectCoordination:
     acknowledgment: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BroadcastCoordination:
     """1-to-many broadcast coordination"""
     mode: Literal['broadcast'] = 'broadcast'
@@ -169,7 +251,7 @@ class BroadcastCoordination:
     partial_success: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConsensusCoordination:
     """Many-to-many consensus coordination"""
     mode: Literal['consensus'] = 'consensus'
@@ -178,7 +260,7 @@ class ConsensusCoordination:
     minimum_participants: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """Individual stage in a pipeline"""
     name: Optional[str] = None
@@ -190,7 +272,7 @@ class PipelineStage:
     timeout: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PipelineCoordination:
     """Sequential pipeline coordination"""
     mode: Literal['pipeline'] = 'pipeline'
@@ -202,6 +284,13 @@ class PipelineCoordination:
 # Union type for all coordination modes
 CoordinationMode = Union[DirectCoordination, BroadcastCoordination, ConsensusCoordination, PipelineCoordination]
 
+# Shared defaults for stateless coordination modes; the classes are frozen,
+# so reusing one instance across messages is safe and allocation-free
+_DIRECT_DEFAULT = DirectCoordination()
+_BROADCAST_ALL = BroadcastCoordination(aggregation='all')
+_BROADCAST_MAJORITY = BroadcastCoordination(aggregation='majority')
+_CONSENSUS_MAJORITY = ConsensusCoordination(consensus_type='majority')
+
 
 # Message Priority
 class MessagePriority(Enum):
@@ -292,6 +381,7 @@ class MCPToolName(Enum):
     CLAUDE_FLOW_DAA_FAULT_TOLERANCE = "mcp__gemini-flow__daa_fault_tolerance"
     CLAUDE_FLOW_DAA_OPTIMIZATION = "mcp__gemini-flow__daa_optimization"
     RUV_SWARM_DAA_INIT = "mcp__ruv-swarm__daa_init"
+    RUV_SWARM_DAA_CONSENSUS = "mcp__ruv-swarm__daa_consensus"
     RUV_SWARM_DAA_AGENT_CREATE = "mcp__ruv-swarm__daa_agent_create"
     RUV_SWARM_DAA_AGENT_ADAPT = "mcp__ruv-swarm__daa_agent_adapt"
     RUV_SWARM_DAA_WORKFLOW_CREATE = "mcp__ruv-swarm__daa_workflow_create"
@@ -347,7 +437,7 @@ class MCPToolName(Enum):
 
 
 # State and Resource Requirements
-@dataclass
+@dataclass(slots=True)
 class StateRequirement:
     """State access requirements"""
     type: Literal['read', 'write', 'exclusive', 'shared']
@@ -357,7 +447,7 @@ class StateRequirement:
     timeout: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRequirement:
     """Resource requirements"""
     type: Literal['cpu', 'memory', 'gpu', 'network', 'storage', 'custom']
@@ -369,7 +459,7 @@ class ResourceRequirement:
 
 
 # Message and Response Types
-@dataclass
+@dataclass(slots=True)
 class AgentIdentifier:
     """Agent identification"""
     agent_id: str
@@ -378,7 +468,7 @@ class AgentIdentifier:
     capabilities: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Execution context for messages"""
     timeout: Optional[float] = None
@@ -387,7 +477,7 @@ class ExecutionContext:
     resources: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AMessage:
     """A2A message structure"""
     target: AgentTarget
@@ -407,7 +497,7 @@ class A2AMessage:
     retry_policy: Optional[RetryPolicy] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseMetadata:
     """Response metadata"""
     agent_version: Optional[str] = None
@@ -416,7 +506,7 @@ class ResponseMetadata:
     state_modifications: Optional[List[Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AError:
     """A2A error information"""
     code: str
@@ -426,7 +516,7 @@ class A2AError:
     suggested_action: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AResponse:
     """A2A response structure"""
     message_id: str
@@ -440,6 +530,128 @@ class A2AResponse:
     performance: Optional[Dict[str, Any]] = None
 
 
+# Shared empty dict for absent response sub-objects (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Enum's value->member map gives O(1) lookups without the constructor's
+# membership check (and returns None for unknown values instead of raising)
+_AGENT_ROLE_BY_VALUE = AgentRole._value2member_map_
+
+# Binary control frames: the chatty control plane (acks, heartbeats) skips
+# JSON entirely -- 1-byte opcode, 16 raw UUID bytes, 8-byte double timestamp.
+# Opcodes stay below 0x20 so the receive path can distinguish control frames
+# from JSON payloads (which start with '{' = 0x7b) by their first byte.
+_CTRL_HDR = struct.Struct('!B16sd')
+_CTRL_ACK = 0x01
+_CTRL_HEARTBEAT = 0x02
+
+# Shared HTTP sessions (opt-in via A2AClientConfig.shared_session), keyed by
+# endpoint + credentials and refcounted so the last client closes the pool
+_SESSION_REGISTRY: Dict[tuple, List[Any]] = {}
+_SESSION_LOCK = asyncio.Lock()
+
+# Outbox ordering: lower number drains first; CRITICAL preempts bulk traffic
+_PRIORITY_ORDER: Dict[MessagePriority, int] = {
+    MessagePriority.CRITICAL: 0,
+    MessagePriority.HIGH: 1,
+    MessagePriority.MEDIUM: 2,
+    MessagePriority.LOW: 3,
+}
+
+# Precomputed member->value LUTs; a dict hit skips the Enum descriptor chain
+# that .value walks on every access (MCPToolName alone has 104 members)
+_TOOL_VALUES: Dict[MCPToolName, str] = {m: m.value for m in MCPToolName}
+_ENUM_VALUES: Dict[Enum, Any] = {
+    **_TOOL_VALUES,
+    **{m: m.value for m in AgentRole},
+    **{m: m.value for m in MessagePriority},
+}
+
+
+class _TTLCache:
+    """Minimal TTL-bounded cache (keeps the SDK free of extra dependencies)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Any] = {}
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if len(self._data) >= self.maxsize:
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in self._data.items() if exp < now]:
+                del self._data[stale]
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values both JSON encoders reject: enums nested in parameters"""
+    if isinstance(obj, Enum):
+        return _ENUM_VALUES.get(obj, obj.value)
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _vote_key(result: Any) -> Any:
+    """Stable, hashable key for a consensus vote payload"""
+    if result is None or isinstance(result, (str, int, float, bool)):
+        return result
+    return json.dumps(result, sort_keys=True, default=str)
+
+
+# Serialization Helpers
+# Per-type serializers are built once from dataclass field schemas and cached,
+# avoiding repeated __dict__ walks and hasattr probes on the hot send path.
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _serialize_value(value: Any) -> Any:
+    """Serialize a single field value"""
+    if isinstance(value, Enum):
+        return _ENUM_VALUES.get(value, value.value)
+    if isinstance(value, list):
+        return [_serialize_value(item) for item in value]
+    if is_dataclass(value):
+        return _dataclass_serializer(type(value))(value)
+    return value
+
+
+def _dataclass_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Get (or build and cache) the serializer for a dataclass type"""
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        # Underscore fields are internal caches, never wire data
+        field_names = tuple(f.name for f in fields(cls)
+                            if not f.name.startswith('_'))
+
+        def serializer(obj: Any, out: Optional[Dict[str, Any]] = None,
+                       _fields=field_names) -> Dict[str, Any]:
+            result = {} if out is None else out
+            for name in _fields:
+                value = getattr(obj, name)
+                if value is not None:
+                    result[name] = _serialize_value(value)
+            return result
+
+        _SERIALIZERS[cls] = serializer
+    return serializer
+
+
 # Custom Exceptions
 class A2AClientError(Exception):
     """A2A Client error"""
@@ -461,6 +673,100 @@ class A2AConnectionError(A2AClientError):
         super().__init__(message, code="A2A_CONNECTION_ERROR")
 
 
+# Only transport-level failures are ever worth retrying; application errors
+# fail fast regardless of their code string
+_RETRYABLE_EXC = (A2ATimeoutError, A2AConnectionError)
+
+
+class A2ABatcher:
+    """Coalesces concurrent message sends into single batch POSTs
+
+    Direct sends submitted within batch_window seconds (or until
+    batch_max_size accumulates) ride in one request to /api/v2/a2a/batch,
+    amortizing TLS and HTTP framing across the burst. If the server answers
+    404/405 the batcher marks itself unsupported and passes messages through
+    individually from then on.
+    """
+
+    def __init__(self, client: 'A2AClient', max_batch: int, max_delay: float):
+        self._client = client
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.Task] = None
+        self._supported = True
+
+    async def submit(self, message: A2AMessage) -> A2AResponse:
+        """Queue a message for the next batch flush and await its response"""
+        if not self._supported:
+            return await self._client._send_unbatched(message)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((message, future))
+        if len(self._pending) >= self._max_batch:
+            if self._flush_handle:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            await self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.create_task(self._delayed_flush())
+        return await future
+
+    async def _delayed_flush(self) -> None:
+        try:
+            await asyncio.sleep(self._max_delay)
+        except asyncio.CancelledError:
+            return
+        self._flush_handle = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        client = self._client
+        try:
+            async with client._http_session.post(
+                '/api/v2/a2a/batch',
+                data=_json_dumps({
+                    'batch': [client._serialize_message(m) for m, _ in pending]
+                }),
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                if response.status in (404, 405):
+                    self._supported = False
+                    await self._fallback(pending)
+                    return
+                response.raise_for_status()
+                data = await response.json()
+        except Exception:
+            await self._fallback(pending)
+            return
+
+        results = data.get('responses', [])
+        for index, (message, future) in enumerate(pending):
+            if future.done():
+                continue
+            if index < len(results):
+                future.set_result(client._deserialize_response(results[index]))
+            else:
+                future.set_exception(A2AClientError(
+                    f"Batch response missing entry for {message.id}",
+                    code="BATCH_INCOMPLETE"
+                ))
+
+    async def _fallback(self, pending: List[tuple]) -> None:
+        """Send a failed batch per-message so no caller is left hanging"""
+        for message, future in pending:
+            if future.done():
+                continue
+            try:
+                future.set_result(await self._client._send_unbatched(message))
+            except Exception as error:
+                future.set_exception(error)
+
+
 # Main A2A Client Class
 class A2AClient:
     """
@@ -480,6 +786,60 @@ class A2AClient:
         self._websocket: Optional[Any] = None
         self._message_queue: Dict[str, asyncio.Future] = {}
         self._connection_pool: Dict[str, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._send_queue: Optional[asyncio.PriorityQueue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._send_seq = itertools.count()
+        self._target_cache = _TTLCache(maxsize=256, ttl=config.target_cache_ttl)
+        self._read_cache = _TTLCache(maxsize=config.read_cache_size,
+                                     ttl=config.read_cache_ttl)
+        self._payload_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._use_msgpack = False
+        self._now = time.time()
+        self._clock_task: Optional[asyncio.Task] = None
+
+        # Message IDs: one epoch + random prefix per client instance, then a
+        # plain counter -- no syscall or RNG read per message
+        self._id_prefix = f"msg_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        self._id_counter = itertools.count(1)
+        self._session_key: Optional[tuple] = None
+        self._httpx_client: Optional[Any] = None
+        self._connected = False
+        self._batcher: Optional[A2ABatcher] = None
+        if config.batching:
+            self._batcher = A2ABatcher(self, config.batch_max_size,
+                                       config.batch_window)
+
+        # Precompiled message templates: the static target/coordination
+        # scaffolding is built once here; helpers replace() in only the
+        # call-varying fields instead of reconstructing the whole graph
+        self._tpl_spawn = A2AMessage(
+            target=GroupTarget(
+                role=AgentRole.SPAWNER,
+                max_agents=1,
+                selection_strategy='load-balanced'
+            ),
+            tool_name=MCPToolName.CLAUDE_FLOW_AGENT_SPAWN,
+            coordination=ConsensusCoordination(
+                consensus_type='majority',
+                minimum_participants=2
+            )
+        )
+        self._tpl_swarm_status = A2AMessage(
+            target=GroupTarget(role=AgentRole.COORDINATOR),
+            tool_name=MCPToolName.CLAUDE_FLOW_SWARM_STATUS,
+            coordination=_BROADCAST_MAJORITY
+        )
+        self._tpl_retrieve_eventual = A2AMessage(
+            target=GroupTarget(role=AgentRole.MEMORY_MANAGER, max_agents=1),
+            tool_name=MCPToolName.CLAUDE_FLOW_MEMORY_USAGE,
+            coordination=_DIRECT_DEFAULT
+        )
+        self._tpl_performance_report = A2AMessage(
+            target=GroupTarget(role=AgentRole.PERFORMANCE_MONITOR, max_agents=1),
+            tool_name=MCPToolName.CLAUDE_FLOW_PERFORMANCE_REPORT,
+            coordination=_DIRECT_DEFAULT
+        )
         
         # SSL context setup
         self._ssl_context = None
@@ -504,29 +864,103 @@ class A2AClient:
     
     async def connect(self) -> None:
         """Establish connections"""
-        # Setup HTTP session
-        connector = aiohttp.TCPConnector(ssl=self._ssl_context)
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        
+        # Bind the running loop once; create_future() on it avoids the
+        # per-message loop lookup that asyncio.Future() performs
+        self._loop = asyncio.get_running_loop()
+
+        # Coarse shared clock: one vDSO call per millisecond instead of one
+        # per message stamped
+        self._now = time.time()
+        self._clock_task = asyncio.create_task(self._tick_clock())
+
         headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'GeminiFlow-A2A-Python-SDK/2.0.0'
         }
-        
+
         if self.config.api_key:
             headers['X-API-Key'] = self.config.api_key
-        
-        self._http_session = aiohttp.ClientSession(
+
+        if self.config.prefer_msgpack and msgpack is not None:
+            headers['Accept'] = 'application/msgpack, application/json'
+
+        if self.config.shared_session:
+            self._http_session = await self._acquire_shared_session(headers)
+        else:
+            self._http_session = self._build_http_session(headers)
+
+        # Optional HTTP/2 transport: concurrent message POSTs share one
+        # stream-multiplexed connection instead of one socket each
+        if self.config.http2:
+            try:
+                import httpx
+                self._httpx_client = httpx.AsyncClient(
+                    base_url=self.config.base_url,
+                    http2=True,
+                    headers=headers,
+                    timeout=self.config.timeout,
+                    verify=self._ssl_context if self._ssl_context else True
+                )
+            except ImportError:
+                self.logger.warning(
+                    "http2=True requires the optional httpx package; "
+                    "falling back to HTTP/1.1 via aiohttp")
+
+        # Setup WebSocket if enabled
+        if self.config.websocket_enabled:
+            await self._setup_websocket()
+
+        self._recompute_connected()
+
+    def _build_http_session(self, headers: Dict[str, str]) -> aiohttp.ClientSession:
+        """Build an HTTP session with an explicitly sized, keep-alive pool
+
+        Sized pools and DNS caching matter here: every request hits the one
+        A2A base URL, so connection reuse dominates HTTP latency.
+        """
+        connector = aiohttp.TCPConnector(
+            ssl=self._ssl_context,
+            limit=self.config.pool_limit,
+            limit_per_host=self.config.pool_limit_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            ttl_dns_cache=self.config.dns_cache_ttl,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
             base_url=self.config.base_url,
             connector=connector,
-            timeout=timeout,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
             headers=headers
         )
-        
-        # Setup WebSocket if enabled
-        if self.config.websocket_enabled:
-            await self._setup_websocket()
-    
+
+    async def _acquire_shared_session(self, headers: Dict[str, str]) -> aiohttp.ClientSession:
+        """Get or create the refcounted shared session for this endpoint"""
+        key = (self.config.base_url, id(self._ssl_context), self.config.api_key)
+        async with _SESSION_LOCK:
+            entry = _SESSION_REGISTRY.get(key)
+            if entry is None:
+                entry = _SESSION_REGISTRY[key] = [self._build_http_session(headers), 0]
+            entry[1] += 1
+            self._session_key = key
+            return entry[0]
+
+    async def _release_http_session(self) -> None:
+        """Close the HTTP session, or drop a reference if it is shared"""
+        if self._http_session is None:
+            return
+        if self._session_key is None:
+            await self._http_session.close()
+        else:
+            async with _SESSION_LOCK:
+                entry = _SESSION_REGISTRY.get(self._session_key)
+                if entry is not None:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        del _SESSION_REGISTRY[self._session_key]
+                        await entry[0].close()
+            self._session_key = None
+        self._http_session = None
+
     async def _setup_websocket(self) -> None:
         """Setup WebSocket connection"""
         try:
@@ -535,52 +969,141 @@ class A2AClient:
             extra_headers = {}
             if self.config.api_key:
                 extra_headers['X-API-Key'] = self.config.api_key
-            
-            self._websocket = await websockets.connect(
+
+            self._websocket = await _ws_connect(
                 ws_url,
                 ssl=self._ssl_context,
-                extra_headers=extra_headers
+                compression=self.config.ws_compression,
+                max_size=self.config.ws_max_size,
+                ping_interval=20,
+                ping_timeout=20,
+                **{_WS_HEADERS_KWARG: extra_headers}
             )
             
-            # Start message handler
+            # Start writer and message handler
+            self._send_queue = asyncio.PriorityQueue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
             asyncio.create_task(self._websocket_message_handler())
-            
+
         except Exception as e:
             self.logger.warning(f"WebSocket connection failed: {e}")
             self._websocket = None
+
+    async def _writer_loop(self) -> None:
+        """Drain queued outbound frames, flushing bursts back-to-back
+
+        Producers enqueue without awaiting the socket, so a burst of sends
+        (e.g. a broadcast fan-out) is written in one pass instead of paying a
+        scheduler round-trip per message. The queue is priority-ordered, so
+        CRITICAL messages jump ahead of queued bulk traffic; a monotonic
+        sequence number keeps FIFO order within a priority level.
+        """
+        try:
+            while True:
+                items = [await self._send_queue.get()]
+                while True:
+                    try:
+                        items.append(self._send_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                for _, _, frame in items:
+                    await self._websocket.send(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Drop the queue so new sends fall back to HTTP instead of
+            # enqueueing frames nothing will ever write
+            self._send_queue = None
+            self.logger.error(f"WebSocket writer failed: {e}")
     
     async def _websocket_message_handler(self) -> None:
-        """Handle incoming WebSocket messages"""
+        """Handle incoming WebSocket messages
+
+        Dispatch is fully synchronous: when the library has several frames
+        buffered (a burst of agent responses), they drain back-to-back in one
+        task step with no scheduler round-trip between frames. That is the
+        closest Python analogue to draining a completion queue in one pass --
+        websockets exposes no non-blocking recv to batch any harder.
+        """
         if not self._websocket:
             return
         
         try:
             async for message in self._websocket:
-                try:
-                    data = json.loads(message)
-                    
-                    if data.get('type') == 'response' and data.get('correlation_id'):
-                        correlation_id = data['correlation_id']
-                        if correlation_id in self._message_queue:
-                            future = self._message_queue.pop(correlation_id)
-                            if not future.done():
-                                future.set_result(data)
-                    
-                except json.JSONDecodeError:
-                    self.logger.error(f"Failed to parse WebSocket message: {message}")
-                except Exception as e:
-                    self.logger.error(f"Error handling WebSocket message: {e}")
+                self._dispatch_frame(message)
         
         except ConnectionClosed:
             self.logger.info("WebSocket connection closed")
         except WebSocketException as e:
             self.logger.error(f"WebSocket error: {e}")
+        finally:
+            self._recompute_connected()
     
+    def _dispatch_frame(self, message: Union[str, bytes]) -> None:
+        """Decode one inbound frame and resolve its waiting future"""
+        if (isinstance(message, (bytes, bytearray)) and message and
+                message[0] < 0x20):
+            self._handle_control_frame(bytes(message))
+            return
+        try:
+            data = _json_loads(message)
+
+            if data.get('type') == 'response' and data.get('correlation_id'):
+                future = self._message_queue.pop(data['correlation_id'], None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+
+        except ValueError:
+            self.logger.error(f"Failed to parse WebSocket message: {message}")
+        except Exception as e:
+            self.logger.error(f"Error handling WebSocket message: {e}")
+
+    def _handle_control_frame(self, frame: bytes) -> None:
+        """Decode and react to a binary control frame (ack/heartbeat)"""
+        try:
+            opcode, frame_id, _timestamp = _CTRL_HDR.unpack(frame)
+        except struct.error:
+            self.logger.error(f"Malformed control frame: {frame!r}")
+            return
+
+        if opcode == _CTRL_HEARTBEAT and self._send_queue is not None:
+            # Echo heartbeats straight back, ahead of any queued bulk traffic
+            reply = _CTRL_HDR.pack(_CTRL_HEARTBEAT, frame_id, time.time())
+            self._send_queue.put_nowait((0, next(self._send_seq), reply))
+        elif opcode == _CTRL_ACK:
+            self.logger.debug(f"Received ack for {frame_id.hex()}")
+
+    async def _tick_clock(self) -> None:
+        """Refresh the coarse timestamp used to stamp outgoing messages"""
+        try:
+            while True:
+                self._now = time.time()
+                await asyncio.sleep(0.001)
+        except asyncio.CancelledError:
+            pass
+
+    def _timestamp(self) -> float:
+        """Current time, coarse by default (see precise_timestamps)"""
+        if self.config.precise_timestamps or self._clock_task is None:
+            return time.time()
+        return self._now
+
     async def disconnect(self) -> None:
         """Close all connections"""
-        if self._http_session:
-            await self._http_session.close()
-        
+        self._connected = False
+        if self._clock_task:
+            self._clock_task.cancel()
+            self._clock_task = None
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._send_queue = None
+
+        await self._release_http_session()
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
+
         if self._websocket:
             await self._websocket.close()
         
@@ -597,150 +1120,569 @@ class A2AClient:
             message.id = self._generate_message_id()
         
         # Add timestamp
-        message.timestamp = time.time()
-        
-        # Apply retry policy
+        message.timestamp = self._timestamp()
+
+        # An explicit agent list under broadcast coordination is fanned out
+        # client-side so the aggregation mode can short-circuit early
+        if isinstance(message.coordination, BroadcastCoordination):
+            if isinstance(message.target, MultipleTargets) and message.target.agent_ids:
+                return await self._send_broadcast(message, message.target.agent_ids)
+            # Group/filter targets fan out too when the server can resolve
+            # them to concrete agents (resolution results are TTL-cached);
+            # single targets fall through to the direct send path
+            if isinstance(message.target, (GroupTarget, BroadcastTarget,
+                                           ConditionalTarget)):
+                agent_ids = await self._resolve_target(message.target)
+                if agent_ids:
+                    return await self._send_broadcast(message, agent_ids)
+
+        # Explicit agent lists under consensus coordination are likewise
+        # fanned out locally and aggregated in one pass over the votes
+        if (isinstance(message.coordination, ConsensusCoordination) and
+                isinstance(message.target, MultipleTargets)):
+            return await self._send_consensus(message, message.target.agent_ids)
+
+        # Pipelines run stage by stage with in-memory state passthrough
+        if (isinstance(message.coordination, PipelineCoordination) and
+                message.coordination.stages):
+            return await self._execute_pipeline(message)
+
+        # Low/medium-priority direct sends may ride a coalesced batch POST;
+        # urgent traffic always goes straight out
+        if (self._batcher is not None and
+                not isinstance(message.coordination, PipelineCoordination) and
+                message.priority not in (MessagePriority.HIGH,
+                                         MessagePriority.CRITICAL)):
+            return await self._batcher.submit(message)
+
+        return await self._send_unbatched(message)
+
+    async def _send_unbatched(self, message: A2AMessage) -> A2AResponse:
+        """Send one message directly, with the configured retry policy"""
         return await self._execute_with_retry(lambda: self._do_send_message(message))
+
+    async def _send_single(self, message: A2AMessage) -> A2AResponse:
+        """Stamp and send one fan-out sub-message, bypassing the batcher
+
+        Broadcast/consensus/quorum fan-outs and pipeline stages rely on their
+        sub-sends being independent (and immediate); coalescing them into one
+        batch POST would serialize exactly the requests meant to race.
+        """
+        if not message.id:
+            message.id = self._generate_message_id()
+        message.timestamp = self._timestamp()
+        return await self._send_unbatched(message)
+
+    def _cached_payload(self, cache_key: tuple,
+                        build: Callable[[], A2AMessage]) -> Dict[str, Any]:
+        """Serialize an idempotent helper message once per argument tuple"""
+        payload = self._payload_cache.get(cache_key)
+        if payload is None:
+            if len(self._payload_cache) >= 256:
+                # Polling workloads reuse a handful of argument tuples; a
+                # blunt reset beats tracking recency for this cache
+                self._payload_cache.clear()
+            payload = self._serialize_message(build())
+            self._payload_cache[cache_key] = payload
+        return payload
+
+    async def send_raw_message(self, payload: Dict[str, Any]) -> A2AResponse:
+        """Send a pre-serialized message payload
+
+        Used by the idempotent polling helpers: the static body is encoded
+        once and only id and timestamp are stamped (on a shallow copy) per
+        call, so dashboards polling the same endpoint skip re-serialization.
+        """
+        wire = dict(payload)
+        wire['id'] = self._generate_message_id()
+        wire['timestamp'] = self._timestamp()
+        return await self._execute_with_retry(lambda: self._do_send_raw(wire))
+
+    async def _do_send_raw(self, wire: Dict[str, Any]) -> A2AResponse:
+        """Internal raw-payload sending"""
+        try:
+            if self._ws_open():
+                frame = _json_dumps({'type': 'message', **wire})
+                return await self._ws_request(wire['id'], frame, self.config.timeout)
+            return await self._http_post(wire)
+        except A2AClientError:
+            raise
+        except Exception as e:
+            raise A2AClientError(f"Message send failed: {str(e)}", details=e)
+
+    async def _resolve_target(self, target: AgentTarget) -> Optional[List[str]]:
+        """Resolve a group/broadcast/conditional target to concrete agent IDs
+
+        Repeated fan-outs against the same target (common in pipelines and
+        monitoring loops) reuse the cached agent set for target_cache_ttl
+        seconds instead of re-querying the server. Returns None when the
+        server does not offer target resolution.
+        """
+        if isinstance(target, SingleTarget):
+            return [target.agent_id]
+        if isinstance(target, MultipleTargets):
+            return target.agent_ids
+
+        serialized = _serialize_value(target)
+        key = (type(target).__name__, json.dumps(serialized, sort_keys=True))
+        cached = self._target_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self._http_session:
+            return None
+        try:
+            async with self._http_session.post(
+                '/api/v2/a2a/resolve',
+                data=_json_dumps({'target': serialized}),
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Resolution is an optimization; any failure (including a hung
+            # endpoint) falls back to the server-coordinated broadcast
+            return None
+
+        agent_ids = data.get('agent_ids')
+        if agent_ids:
+            self._target_cache.set(key, agent_ids)
+        return agent_ids
+
+    async def _send_broadcast(self, message: A2AMessage, agent_ids: List[str]) -> A2AResponse:
+        """Fan a broadcast out to explicit agents, honoring the aggregation mode
+
+        'first'/'any' return as soon as any agent answers, 'majority' returns
+        once n//2+1 responses arrive, and only 'all' waits for the slowest
+        agent. Stragglers are cancelled on early return.
+        """
+        coordination = message.coordination
+        tasks = [
+            asyncio.ensure_future(self._send_single(
+                replace(message, id=None, target=SingleTarget(agent_id=agent_id))
+            ))
+            for agent_id in agent_ids
+        ]
+
+        try:
+            if coordination.aggregation in ('first', 'any'):
+                # First *answer* wins: agents that error out are skipped so a
+                # fast failure cannot abort a broadcast another agent is
+                # about to satisfy
+                for pending in asyncio.as_completed(tasks, timeout=coordination.timeout):
+                    try:
+                        return await pending
+                    except A2AClientError:
+                        continue
+                raise A2AClientError(
+                    "No agents responded to the broadcast",
+                    code="BROADCAST_ALL_FAILED"
+                )
+
+            if coordination.aggregation == 'majority':
+                quorum = len(tasks) // 2 + 1
+                responses = []
+                for pending in asyncio.as_completed(tasks, timeout=coordination.timeout):
+                    try:
+                        responses.append(await pending)
+                    except A2AClientError:
+                        if not coordination.partial_success:
+                            raise
+                        continue
+                    if len(responses) >= quorum:
+                        return self._aggregate_broadcast(message, responses)
+                raise A2AClientError(
+                    "Broadcast did not reach a majority",
+                    code="BROADCAST_NO_MAJORITY"
+                )
+
+            # 'all'
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *tasks, return_exceptions=coordination.partial_success),
+                timeout=coordination.timeout
+            )
+            responses = [r for r in results if isinstance(r, A2AResponse)]
+            if not responses:
+                # partial_success tolerates some failures, not a broadcast
+                # nobody answered (mirrors the majority path's no-quorum error)
+                raise A2AClientError(
+                    "No agents responded to the broadcast",
+                    code="BROADCAST_ALL_FAILED"
+                )
+            return self._aggregate_broadcast(message, responses)
+
+        except asyncio.TimeoutError:
+            raise A2ATimeoutError(
+                f"Broadcast timed out after {coordination.timeout}s")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _execute_pipeline(self, message: A2AMessage) -> A2AResponse:
+        """Run pipeline stages sequentially with zero-copy state passthrough
+
+        With state_passthrough enabled each stage's result object is handed to
+        the next stage's parameters by reference -- no intermediate JSON
+        encode/decode cycle inside the client. Serialization happens exactly
+        once per stage, when the stage message actually goes over the wire.
+        """
+        coordination = message.coordination
+        prev_result: Any = None
+        have_result = False
+        response: Optional[A2AResponse] = None
+
+        for stage in coordination.stages:
+            parameters = dict(stage.parameters) if stage.parameters else {}
+            if coordination.state_passthrough and have_result:
+                parameters['prev_result'] = prev_result
+
+            stage_message = replace(
+                message,
+                id=None,
+                target=stage.agent_target or message.target,
+                tool_name=stage.tool_name or message.tool_name,
+                parameters=parameters,
+                coordination=DirectCoordination(timeout=stage.timeout)
+            )
+
+            try:
+                response = await self._send_single(stage_message)
+            except A2AClientError:
+                if coordination.failure_strategy == 'skip':
+                    continue
+                raise  # 'abort'; 'retry' already happened inside send_message
+
+            if not response.success:
+                if coordination.failure_strategy == 'skip':
+                    continue
+                return response
+
+            prev_result = response.result
+            have_result = True
+
+        if response is None:
+            raise A2AClientError("Pipeline produced no response",
+                                 code="PIPELINE_EMPTY")
+        return response
+
+    async def _send_consensus(self, message: A2AMessage, agent_ids: List[str]) -> A2AResponse:
+        """Collect votes from explicit agents and aggregate them"""
+        coordination = message.coordination
+        tasks = [
+            asyncio.ensure_future(self._send_single(
+                replace(message, id=None, target=SingleTarget(agent_id=agent_id))
+            ))
+            for agent_id in agent_ids
+        ]
+
+        # Failed voters simply don't contribute; quorum is checked below
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True),
+                timeout=coordination.voting_timeout
+            )
+        except asyncio.TimeoutError:
+            raise A2ATimeoutError(
+                f"Consensus voting timed out after {coordination.voting_timeout}s")
+        responses = [r for r in results if isinstance(r, A2AResponse) and r.success]
+        return self._aggregate_consensus(message, responses)
+
+    def _aggregate_consensus(self, message: A2AMessage,
+                             responses: List[A2AResponse]) -> A2AResponse:
+        """Aggregate consensus votes in a single linear pass
+
+        Votes are scored into a defaultdict (count for 'majority'/'unanimous',
+        confidence-weighted for 'weighted') and the argmax wins -- O(n) with
+        no nested per-agent loops or sorting.
+        """
+        coordination = message.coordination
+        minimum = coordination.minimum_participants
+        if minimum and len(responses) < minimum:
+            return self._consensus_failure(
+                message, 'CONSENSUS_NO_QUORUM',
+                f"Only {len(responses)} of {minimum} required participants voted")
+
+        scores: Dict[Any, float] = defaultdict(float)
+        winners: Dict[Any, A2AResponse] = {}
+        for response in responses:
+            key = _vote_key(response.result)
+            if coordination.consensus_type == 'weighted':
+                confidence = 1.0
+                if response.performance:
+                    confidence = float(response.performance.get('confidence', 1.0))
+                scores[key] += confidence
+            else:
+                scores[key] += 1.0
+            winners.setdefault(key, response)
+
+        if not scores:
+            return self._consensus_failure(
+                message, 'CONSENSUS_NO_VOTES', "No successful votes received")
+
+        winner = max(scores, key=scores.get)
+        if coordination.consensus_type == 'unanimous' and len(scores) > 1:
+            return self._consensus_failure(
+                message, 'CONSENSUS_NOT_UNANIMOUS',
+                f"{len(scores)} distinct votes received")
+        if (coordination.consensus_type == 'majority' and
+                scores[winner] * 2 <= len(responses)):
+            return self._consensus_failure(
+                message, 'CONSENSUS_NO_MAJORITY',
+                "No vote reached a strict majority")
+
+        return winners[winner]
+
+    def _consensus_failure(self, message: A2AMessage, code: str,
+                           detail: str) -> A2AResponse:
+        """Build a failed consensus response"""
+        return A2AResponse(
+            message_id=message.id,
+            source=AgentIdentifier(agent_id='consensus'),
+            success=False,
+            timestamp=time.time(),
+            metadata=ResponseMetadata(),
+            error=A2AError(code=code, message=detail, recoverable=True)
+        )
+
+    def _aggregate_broadcast(self, message: A2AMessage,
+                             responses: List[A2AResponse]) -> A2AResponse:
+        """Combine per-agent broadcast responses into one aggregate response"""
+        return A2AResponse(
+            message_id=message.id,
+            source=AgentIdentifier(agent_id='broadcast'),
+            success=all(r.success for r in responses),
+            timestamp=time.time(),
+            metadata=ResponseMetadata(),
+            result=[r.result for r in responses]
+        )
     
     async def _do_send_message(self, message: A2AMessage) -> A2AResponse:
         """Internal message sending"""
         try:
-            if self._websocket and not self._websocket.closed:
+            if self._ws_open():
                 return await self._send_via_websocket(message)
             else:
                 return await self._send_via_http(message)
+        except A2AClientError:
+            raise  # keep the concrete class so the retry policy can match it
         except Exception as e:
             raise A2AClientError(f"Message send failed: {str(e)}", details=e)
     
+    def _ws_open(self) -> bool:
+        """True if the WebSocket connection is usable"""
+        ws = self._websocket
+        if ws is None:
+            return False
+        closed = getattr(ws, 'closed', None)  # legacy client
+        if closed is not None:
+            return not closed
+        return ws.close_code is None  # new asyncio client
+
     async def _send_via_websocket(self, message: A2AMessage) -> A2AResponse:
         """Send message via WebSocket"""
+        timeout = message.execution.timeout if message.execution else self.config.timeout
+        frame = _json_dumps(self._serialize_message(message, 'message'))
+        priority = _PRIORITY_ORDER[message.priority or MessagePriority.MEDIUM]
+        return await self._ws_request(message.id, frame, timeout, priority)
+
+    async def _ws_request(self, message_id: str, frame: bytes, timeout: float,
+                          priority: int = 2) -> A2AResponse:
+        """Send one pre-encoded frame and await its correlated response"""
         if not self._websocket:
             raise A2AConnectionError("WebSocket not connected")
-        
-        timeout = message.execution.timeout if message.execution else self.config.timeout
-        
+
         # Create future for response
-        future = asyncio.Future()
-        self._message_queue[message.id] = future
-        
+        loop = self._loop or asyncio.get_running_loop()
+        future = loop.create_future()
+        self._message_queue[message_id] = future
+
         try:
-            # Send message
-            await self._websocket.send(json.dumps({
-                'type': 'message',
-                **self._serialize_message(message)
-            }))
-            
+            # websockets accepts bytes frames; frames go through the writer
+            # queue so bursts coalesce into one flush
+            if self._send_queue is not None:
+                self._send_queue.put_nowait((priority, next(self._send_seq), frame))
+            else:
+                await self._websocket.send(frame)
+
             # Wait for response
             response_data = await asyncio.wait_for(future, timeout=timeout)
             return self._deserialize_response(response_data)
-        
+
         except asyncio.TimeoutError:
-            self._message_queue.pop(message.id, None)
+            self._message_queue.pop(message_id, None)
             raise A2ATimeoutError(f"WebSocket message timeout after {timeout}s")
         except Exception as e:
-            self._message_queue.pop(message.id, None)
+            self._message_queue.pop(message_id, None)
             raise A2AClientError(f"WebSocket send failed: {str(e)}")
     
     async def _send_via_http(self, message: A2AMessage) -> A2AResponse:
         """Send message via HTTP"""
+        return await self._http_post(self._serialize_message(message))
+
+    def _encode_body(self, payload: Dict[str, Any]) -> tuple:
+        """Encode a payload in the negotiated wire format"""
+        if self._use_msgpack:
+            body = msgpack.packb(payload, use_bin_type=True,
+                                 default=_json_default)
+            headers = {'Content-Type': 'application/msgpack'}
+        else:
+            body = _json_dumps(payload)
+            headers = {'Content-Type': 'application/json'}
+        if (self.config.http_compression and
+                len(body) >= self.config.compression_threshold):
+            # Responses need no mirror handling: aiohttp inflates them itself
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        return body, headers
+
+    def _decode_body(self, content_type: str, raw: bytes) -> Dict[str, Any]:
+        """Decode a response body, latching msgpack once the server uses it"""
+        if 'msgpack' in content_type and msgpack is not None:
+            if self.config.prefer_msgpack:
+                self._use_msgpack = True
+            return msgpack.unpackb(raw, raw=False)
+        return _json_loads(raw)
+
+    async def _http_post(self, payload: Dict[str, Any]) -> A2AResponse:
+        """POST one message payload in the negotiated wire format"""
         if not self._http_session:
             raise A2AConnectionError("HTTP session not initialized")
-        
+
+        body, headers = self._encode_body(payload)
+
+        if self._httpx_client is not None:
+            import httpx
+            try:
+                response = await self._httpx_client.post(
+                    '/api/v2/a2a/message', content=body, headers=headers)
+                response.raise_for_status()
+                data = self._decode_body(
+                    response.headers.get('content-type', ''), response.content)
+                return self._deserialize_response(data)
+            except httpx.TimeoutException as e:
+                raise A2ATimeoutError(f"HTTP/2 request timed out: {str(e)}")
+            except httpx.HTTPStatusError as e:
+                raise A2AClientError(f"HTTP/2 request failed: {str(e)}")
+            except httpx.TransportError as e:
+                raise A2AConnectionError(f"HTTP/2 connection failed: {str(e)}")
+            except Exception as e:
+                raise A2AClientError(f"HTTP/2 request failed: {str(e)}")
+
+        # Transport-level failures map onto the retryable exception classes
+        # (A2ATimeoutError / A2AConnectionError) so the retry policy can see
+        # them; HTTP status errors stay non-retryable base A2AClientErrors
         try:
             async with self._http_session.post(
                 '/api/v2/a2a/message',
-                json=self._serialize_message(message)
+                data=body,
+                headers=headers
             ) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = self._decode_body(
+                    response.headers.get('Content-Type', ''),
+                    await response.read())
                 return self._deserialize_response(data)
-        
+
+        except aiohttp.ClientResponseError as e:
+            raise A2AClientError(f"HTTP request failed: {str(e)}")
+        except aiohttp.ServerTimeoutError as e:
+            raise A2ATimeoutError(f"HTTP request timed out: {str(e)}")
+        except aiohttp.ClientConnectionError as e:
+            raise A2AConnectionError(f"HTTP connection failed: {str(e)}")
         except aiohttp.ClientError as e:
             raise A2AClientError(f"HTTP request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise A2ATimeoutError(
+                f"HTTP request timed out after {self.config.timeout}s")
     
     async def _execute_with_retry(self, operation: Callable) -> A2AResponse:
         """Execute operation with retry policy"""
         policy = self.config.retry_policy
+        retryable_codes = policy._retryable_set
         last_error = None
-        
+
         for attempt in range(policy.max_retries + 1):
             try:
                 return await operation()
             except Exception as error:
                 last_error = error
-                
-                # Check if error is retryable
-                error_code = getattr(error, 'code', str(type(error).__name__))
-                if error_code not in policy.retryable_errors or attempt == policy.max_retries:
+
+                # Retry only transport-level errors with a retryable code
+                error_code = getattr(error, 'code', type(error).__name__)
+                if (not isinstance(error, _RETRYABLE_EXC) or
+                        error_code not in retryable_codes or
+                        attempt == policy.max_retries):
                     raise error
-                
-                # Calculate delay
+
+                # Calculate delay; exponential backoff is jittered so
+                # concurrent broadcast retries don't stampede the server
                 if policy.backoff_strategy == 'exponential':
-                    delay = min(policy.base_delay * (2 ** attempt), policy.max_delay)
+                    delay = min(
+                        policy.max_delay,
+                        random.uniform(policy.base_delay,
+                                       policy.base_delay * 3 * (2 ** attempt))
+                    )
                 else:  # linear
                     delay = min(policy.base_delay * (attempt + 1), policy.max_delay)
-                
+
                 await asyncio.sleep(delay)
-        
+
         raise last_error
     
-    def _serialize_message(self, message: A2AMessage) -> Dict[str, Any]:
-        """Serialize A2A message to dict"""
-        def serialize_obj(obj):
-            if hasattr(obj, '__dict__'):
-                result = {}
-                for key, value in obj.__dict__.items():
-                    if value is not None:
-                        if isinstance(value, Enum):
-                            result[key] = value.value
-                        elif isinstance(value, list):
-                            result[key] = [serialize_obj(item) for item in value]
-                        elif hasattr(value, '__dict__'):
-                            result[key] = serialize_obj(value)
-                        else:
-                            result[key] = value
-                return result
-            elif isinstance(obj, Enum):
-                return obj.value
-            else:
-                return obj
-        
-        return serialize_obj(message)
+    def _serialize_message(self, message: A2AMessage,
+                           envelope: Optional[str] = None) -> Dict[str, Any]:
+        """Serialize A2A message to dict using cached field schemas
+
+        When envelope is given, the wire 'type' tag is seeded into the result
+        up front instead of being merged in with a second dict build.
+        """
+        serializer = _dataclass_serializer(type(message))
+        if envelope is None:
+            return serializer(message)
+        return serializer(message, {'type': envelope})
     
     def _deserialize_response(self, data: Dict[str, Any]) -> A2AResponse:
         """Deserialize response data to A2AResponse"""
-        # Basic deserialization - in production this would be more robust
+        # Bind sub-dicts once instead of re-fetching them per field
+        src = data.get('source') or _EMPTY
+        err = data.get('error')
+        meta = data.get('metadata') or _EMPTY
+        agent_type = src.get('agent_type')
+
         return A2AResponse(
             message_id=data.get('message_id', ''),
             correlation_id=data.get('correlation_id'),
             source=AgentIdentifier(
-                agent_id=data.get('source', {}).get('agent_id', ''),
-                agent_type=AgentRole(data.get('source', {}).get('agent_type')) if data.get('source', {}).get('agent_type') else None,
-                swarm_id=data.get('source', {}).get('swarm_id'),
-                capabilities=data.get('source', {}).get('capabilities')
+                agent_id=src.get('agent_id', ''),
+                agent_type=_AGENT_ROLE_BY_VALUE.get(agent_type) if agent_type else None,
+                swarm_id=src.get('swarm_id'),
+                capabilities=src.get('capabilities')
             ),
             success=data.get('success', False),
             result=data.get('result'),
             error=A2AError(
-                code=data.get('error', {}).get('code', ''),
-                message=data.get('error', {}).get('message', ''),
-                details=data.get('error', {}).get('details'),
-                recoverable=data.get('error', {}).get('recoverable', False),
-                suggested_action=data.get('error', {}).get('suggested_action')
-            ) if data.get('error') else None,
-            timestamp=data.get('timestamp', time.time()),
+                code=err.get('code', ''),
+                message=err.get('message', ''),
+                details=err.get('details'),
+                recoverable=err.get('recoverable', False),
+                suggested_action=err.get('suggested_action')
+            ) if err else None,
+            timestamp=data.get('timestamp', self._timestamp()),
             metadata=ResponseMetadata(
-                agent_version=data.get('metadata', {}).get('agent_version'),
-                processing_time=data.get('metadata', {}).get('processing_time'),
-                resources_used=data.get('metadata', {}).get('resources_used'),
-                state_modifications=data.get('metadata', {}).get('state_modifications')
+                agent_version=meta.get('agent_version'),
+                processing_time=meta.get('processing_time'),
+                resources_used=meta.get('resources_used'),
+                state_modifications=meta.get('state_modifications')
             ),
             performance=data.get('performance')
         )
     
     def _generate_message_id(self) -> str:
         """Generate unique message ID"""
-        return f"msg_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
+        return f"{self._id_prefix}_{next(self._id_counter)}"
     
     # High-level helper methods
     
@@ -756,9 +1698,9 @@ class A2AClient:
         tool_name = (MCPToolName.CLAUDE_FLOW_SWARM_INIT if provider == 'claude-flow' 
                     else MCPToolName.RUV_SWARM_SWARM_INIT)
         
-        coordination = (BroadcastCoordination(aggregation='all', timeout=30.0) 
-                       if coordination_mode == 'broadcast' 
-                       else ConsensusCoordination(consensus_type='majority'))
+        coordination = (BroadcastCoordination(aggregation='all', timeout=30.0)
+                       if coordination_mode == 'broadcast'
+                       else _CONSENSUS_MAJORITY)
         
         return await self.send_message(A2AMessage(
             target=GroupTarget(role=AgentRole.COORDINATOR),
@@ -779,26 +1721,14 @@ class A2AClient:
         placement_strategy: Literal['load-balanced', 'capability-matched', 'geographic'] = 'load-balanced'
     ) -> A2AResponse:
         """Spawn a new agent"""
-        return await self.send_message(A2AMessage(
-            target=GroupTarget(
-                role=AgentRole.SPAWNER,
-                max_agents=1,
-                selection_strategy='load-balanced'
-            ),
-            tool_name=MCPToolName.CLAUDE_FLOW_AGENT_SPAWN,
-            parameters={
-                'type': agent_type.value,
-                'name': name,
-                'capabilities': capabilities,
-                'placement': {
-                    'strategy': placement_strategy
-                }
-            },
-            coordination=ConsensusCoordination(
-                consensus_type='majority',
-                minimum_participants=2
-            )
-        ))
+        return await self.send_message(replace(self._tpl_spawn, parameters={
+            'type': _ENUM_VALUES[agent_type],
+            'name': name,
+            'capabilities': capabilities,
+            'placement': {
+                'strategy': placement_strategy
+            }
+        }))
     
     async def orchestrate_task(
         self,
@@ -846,7 +1776,7 @@ class A2AClient:
         replication_factor: int = 3
     ) -> A2AResponse:
         """Store data in distributed memory"""
-        return await self.send_message(A2AMessage(
+        response = await self.send_message(A2AMessage(
             target=GroupTarget(
                 role=AgentRole.MEMORY_MANAGER,
                 max_agents=replication_factor
@@ -870,6 +1800,9 @@ class A2AClient:
                 consistency=consistency
             )]
         ))
+        # A completed store supersedes any cached eventual read of this key
+        self._read_cache.pop((namespace, key))
+        return response
     
     async def retrieve_memory(
         self,
@@ -877,31 +1810,89 @@ class A2AClient:
         namespace: str = 'default',
         consistency: Literal['eventual', 'strong', 'causal'] = 'eventual'
     ) -> A2AResponse:
-        """Retrieve data from distributed memory"""
-        max_agents = 3 if consistency == 'strong' else 1
-        coordination = (ConsensusCoordination(consensus_type='majority') 
-                       if consistency == 'strong' 
-                       else DirectCoordination())
-        
-        return await self.send_message(A2AMessage(
-            target=GroupTarget(
-                role=AgentRole.MEMORY_MANAGER,
-                max_agents=max_agents
-            ),
-            tool_name=MCPToolName.CLAUDE_FLOW_MEMORY_USAGE,
+        """Retrieve data from distributed memory
+
+        Eventual-consistency reads are served from a client-side TTL cache
+        when possible; strong reads always go to the swarm.
+        """
+        cache_key = None
+        if consistency == 'eventual' and self.config.read_cache_ttl > 0:
+            cache_key = (namespace, key)
+            cached = self._read_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        read = replace(
+            self._tpl_retrieve_eventual,
             parameters={
                 'action': 'retrieve',
                 'key': key,
                 'namespace': namespace
             },
-            coordination=coordination,
             state_requirements=[StateRequirement(
                 type='read',
                 namespace=namespace,
                 keys=[key],
                 consistency=consistency
             )]
-        ))
+        )
+
+        if consistency == 'strong':
+            # Hedged quorum read: ask three replicas in parallel and return
+            # as soon as two agree, so the slowest replica never sets p99
+            return await self._fanout_quorum(read)
+
+        response = await self.send_message(read)
+
+        if cache_key is not None and response.success:
+            self._read_cache.set(cache_key, response)
+        return response
+
+    async def _fanout_quorum(self, message: A2AMessage, replicas: int = 3,
+                             required: int = 2) -> A2AResponse:
+        """Fan identical reads out to replicas and early-stop on agreement
+
+        Returns the first response whose value `required` replicas agree on,
+        cancelling stragglers; latency tracks the `required`-th fastest
+        replica instead of the slowest.
+        """
+        tasks = [
+            asyncio.ensure_future(self._send_single(replace(message, id=None)))
+            for _ in range(replicas)
+        ]
+        counts: Dict[Any, int] = {}
+        winners: Dict[Any, A2AResponse] = {}
+        failures = 0
+
+        try:
+            for pending in asyncio.as_completed(tasks):
+                try:
+                    response = await pending
+                except A2AClientError:
+                    response = None
+                if response is None or not response.success:
+                    failures += 1
+                    if failures > replicas - required:
+                        raise A2AClientError(
+                            "Too many replicas failed for a quorum read",
+                            code="QUORUM_READ_FAILED"
+                        )
+                    continue
+
+                vote = _vote_key(response.result)
+                counts[vote] = counts.get(vote, 0) + 1
+                winners.setdefault(vote, response)
+                if counts[vote] >= required:
+                    return winners[vote]
+
+            raise A2AClientError(
+                "Replicas did not agree on a quorum read",
+                code="QUORUM_NO_AGREEMENT"
+            )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
     
     async def train_neural_model(
         self,
@@ -912,23 +1903,39 @@ class A2AClient:
         coordination_mode: Literal['parameter-server', 'all-reduce', 'federated'] = 'parameter-server'
     ) -> A2AResponse:
         """Train neural model with distributed agents"""
-        agent_ids = [p['agent_id'] for p in participants]
-        
+        # One pass over participants instead of four: the full id list, the
+        # worker ids, and the coordinator all fall out of the same loop
+        agent_ids: List[str] = []
+        workers: List[str] = []
+        coordinator: Optional[str] = None
+        for participant in participants:
+            participant_id = participant['agent_id']
+            role = participant.get('role')
+            agent_ids.append(participant_id)
+            if role == 'worker':
+                workers.append(participant_id)
+            elif role == 'coordinator' and coordinator is None:
+                coordinator = participant_id
+
+        if coordinator is None:
+            raise A2AClientError(
+                "train_neural_model requires a participant with role "
+                "'coordinator'", code="MISSING_COORDINATOR")
+
+        train_tool = _TOOL_VALUES[MCPToolName.CLAUDE_FLOW_NEURAL_TRAIN]
         stages = [
             PipelineStage(
                 name='initialization',
-                agent_target=SingleTarget(agent_id=next(
-                    p['agent_id'] for p in participants if p.get('role') == 'coordinator'
-                )),
-                tool_name=MCPToolName.CLAUDE_FLOW_NEURAL_TRAIN.value
+                agent_target=SingleTarget(agent_id=coordinator),
+                tool_name=train_tool
             ),
             PipelineStage(
                 name='distributed-training',
                 agent_target=MultipleTargets(
-                    agent_ids=[p['agent_id'] for p in participants if p.get('role') == 'worker'],
+                    agent_ids=workers,
                     coordination_mode='parallel'
                 ),
-                tool_name=MCPToolName.CLAUDE_FLOW_NEURAL_TRAIN.value
+                tool_name=train_tool
             )
         ]
         
@@ -951,7 +1958,7 @@ class A2AClient:
             ),
             resource_requirements=[ResourceRequirement(
                 type='gpu',
-                amount=len([p for p in participants if p.get('role') == 'worker']),
+                amount=len(workers),
                 unit='device',
                 priority=MessagePriority.HIGH
             )]
@@ -968,6 +1975,7 @@ class A2AClient:
     ) -> A2AResponse:
         """Initiate consensus among agents"""
         agent_ids = [p['agent_id'] for p in participants]
+        quorum = len(agent_ids) // 2 + 1
         
         return await self.send_message(A2AMessage(
             target=MultipleTargets(
@@ -988,7 +1996,7 @@ class A2AClient:
             coordination=ConsensusCoordination(
                 consensus_type='majority',
                 voting_timeout=timeout,
-                minimum_participants=len(participants) // 2 + 1
+                minimum_participants=quorum
             )
         ))
     
@@ -1023,45 +2031,70 @@ class A2AClient:
         components: Optional[List[str]] = None
     ) -> A2AResponse:
         """Generate performance report"""
-        return await self.send_message(A2AMessage(
-            target=GroupTarget(
-                role=AgentRole.PERFORMANCE_MONITOR,
-                max_agents=1
-            ),
-            tool_name=MCPToolName.CLAUDE_FLOW_PERFORMANCE_REPORT,
-            parameters={
+        payload = self._cached_payload(
+            ('performance_report', format, timeframe,
+             tuple(components) if components else None),
+            lambda: replace(self._tpl_performance_report, parameters={
                 'format': format,
                 'timeframe': timeframe,
                 'components': components
-            },
-            coordination=DirectCoordination()
-        ))
+            })
+        )
+        return await self.send_raw_message(payload)
     
     # Utility methods
     
     async def get_swarm_status(self, swarm_id: Optional[str] = None) -> A2AResponse:
         """Get swarm status"""
-        return await self.send_message(A2AMessage(
-            target=GroupTarget(role=AgentRole.COORDINATOR),
-            tool_name=MCPToolName.CLAUDE_FLOW_SWARM_STATUS,
-            parameters={'swarmId': swarm_id} if swarm_id else {},
-            coordination=BroadcastCoordination(aggregation='majority')
-        ))
+        payload = self._cached_payload(
+            ('swarm_status', swarm_id),
+            lambda: replace(
+                self._tpl_swarm_status,
+                parameters={'swarmId': swarm_id} if swarm_id else {}
+            )
+        )
+        return await self.send_raw_message(payload)
     
     async def list_agents(self, filter: Optional[AgentFilter] = None) -> A2AResponse:
         """List all agents"""
-        return await self.send_message(A2AMessage(
-            target=BroadcastTarget(filter=filter),
-            tool_name=MCPToolName.CLAUDE_FLOW_AGENT_LIST,
-            parameters={'filter': filter.__dict__ if filter else None},
-            coordination=BroadcastCoordination(aggregation='all')
-        ))
+        serialized_filter = _serialize_value(filter) if filter else None
+        payload = self._cached_payload(
+            ('list_agents',
+             json.dumps(serialized_filter, sort_keys=True) if filter else None),
+            lambda: A2AMessage(
+                target=BroadcastTarget(filter=filter),
+                tool_name=MCPToolName.CLAUDE_FLOW_AGENT_LIST,
+                parameters={'filter': serialized_filter},
+                coordination=_BROADCAST_ALL
+            )
+        )
+        return await self.send_raw_message(payload)
     
     def is_connected(self) -> bool:
         """Check if client is connected"""
-        return (self._http_session is not None and not self._http_session.closed and
-                (not self.config.websocket_enabled or 
-                 (self._websocket is not None and not self._websocket.closed)))
+        return self._connected
+
+    def _recompute_connected(self) -> None:
+        """Refresh the cached connection state (connect/disconnect/ws-close)"""
+        self._connected = (
+            self._http_session is not None and not self._http_session.closed and
+            (not self.config.websocket_enabled or self._ws_open())
+        )
+
+
+# Type-keyed validators: one dict dispatch replaces a chain of isinstance
+# checks per message
+_TARGET_VALIDATORS: Dict[type, Callable[[Any], List[str]]] = {
+    MultipleTargets: lambda t: (
+        [] if t.agent_ids else ["Multiple target requires at least one agent ID"]),
+    GroupTarget: lambda t: (
+        [] if t.role else ["Group target requires a role"]),
+}
+
+_COORDINATION_VALIDATORS: Dict[type, Callable[[Any], List[str]]] = {
+    PipelineCoordination: lambda c: (
+        [] if c.stages else ["Pipeline coordination requires at least one stage"]),
+}
 
 
 # Utility Functions
@@ -1166,27 +2199,36 @@ class A2AUtils:
         
         if not message.coordination:
             errors.append("Coordination mode is required")
-        
-        # Validate target-specific requirements
-        if (isinstance(message.target, MultipleTargets) and 
-            (not message.target.agent_ids or len(message.target.agent_ids) == 0)):
-            errors.append("Multiple target requires at least one agent ID")
-        
-        if isinstance(message.target, GroupTarget) and not message.target.role:
-            errors.append("Group target requires a role")
-        
-        # Validate coordination-specific requirements
-        if (isinstance(message.coordination, PipelineCoordination) and
-            (not message.coordination.stages or len(message.coordination.stages) == 0)):
-            errors.append("Pipeline coordination requires at least one stage")
-        
+
+        # Type-specific requirements dispatch through the validator tables
+        validator = _TARGET_VALIDATORS.get(type(message.target))
+        if validator:
+            errors.extend(validator(message.target))
+
+        validator = _COORDINATION_VALIDATORS.get(type(message.coordination))
+        if validator:
+            errors.extend(validator(message.coordination))
+
         return errors
 
 
 # Example usage context manager
 @asynccontextmanager
 async def create_a2a_client(config: A2AClientConfig):
-    """Context manager for A2A client"""
+    """Context manager for A2A client
+
+    Installs uvloop's event-loop policy when available (opt out with
+    use_uvloop=False). Note that a policy swap only affects loops created
+    afterwards -- callers embedding the client in an already-running loop
+    (e.g. Jupyter) should call uvloop.install() themselves at startup.
+    """
+    if config.use_uvloop and sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass  # optional accelerator; the default loop works fine
+
     client = A2AClient(config)
     try:
         await client.connect()